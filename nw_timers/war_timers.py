@@ -1,7 +1,6 @@
 import datetime
 
-from dateutil.relativedelta import relativedelta
-
+import humanize
 from redbot.core import Config, commands
 from redbot.core.utils.predicates import ReactionPredicate
 from redbot.core.utils.menus import start_adding_reactions
@@ -29,6 +28,8 @@ VALID_ZONES = [
     "Reekwater",
     "Shattered Mountain",
 ]
+_LOWER_ZONES = [z.lower() for z in VALID_ZONES]
+_LOWER_ZONES_SET = frozenset(_LOWER_ZONES)
 
 
 class WarTimers(commands.Cog):
@@ -51,6 +52,7 @@ class WarTimers(commands.Cog):
     @war.command()
     async def next(self, ctx, specific_zone: str = None):
         "Get the next upcoming war"
+        now = datetime.datetime.now()
         timer, zone = None, None
         if specific_zone is not None:
 
@@ -61,14 +63,14 @@ class WarTimers(commands.Cog):
                 return
 
             # Get the zone timer
-            timer = await self.get_timer_for_zone(ctx, proper_zone)
+            timer = await self.get_timer_for_zone(ctx, proper_zone, now)
             if not timer:
                 await ctx.send(f"There are no upcoming wars for {proper_zone}.")
                 return
 
-            relative_time = relativedelta(timer, datetime.datetime.now())
+            relative_time = humanize_delta(timer - now)
             await ctx.send(
-                f"The next war for {proper_zone}, is in {humanize_delta(relative_time, 'minutes')}."
+                f"The next war for {proper_zone}, is in {relative_time}."
             )
             return
 
@@ -78,7 +80,7 @@ class WarTimers(commands.Cog):
 
         # iterate through VALID_ZONE and get the next upcoming war
         for zone in VALID_ZONES:
-            timer = await self.get_timer_for_zone(ctx, zone)
+            timer = await self.get_timer_for_zone(ctx, zone, now)
             if not timer:
                 continue
             if upcoming_war[1] is None:
@@ -91,9 +93,9 @@ class WarTimers(commands.Cog):
         if not zone:
             await ctx.send(f"There are no upcoming wars.")
             return
-        relative_time = relativedelta(timer, datetime.datetime.now())
+        relative_time = humanize_delta(timer - now)
         await ctx.send(
-            f"The next war is for {zone}, in {humanize_delta(relative_time, 'minutes')}."
+            f"The next war is for {zone}, in {relative_time}."
         )
 
     @war.command()
@@ -106,20 +108,21 @@ class WarTimers(commands.Cog):
             await ctx.send(f"Unable to parse timestamp, try 24h3m or something else.")
             return
 
-        war_time = datetime.datetime.now() + relative_delta
+        now = datetime.datetime.now()
+        war_time = now + relative_delta
 
         proper_zone = self.get_proper_zone(zone)
         if not proper_zone:
             await ctx.send(f"{zone} is not a valid zone.")
             return
 
-        timer = await self.get_timer_for_zone(ctx, proper_zone)
+        timer = await self.get_timer_for_zone(ctx, proper_zone, now)
         if timer:
             await ctx.send(f"Replacing existing timer for zone: {timer}.")
 
         await self.add_timer_for_zone(ctx, proper_zone, war_time)
         await ctx.send(
-            f"War timer created for {proper_zone}, in {humanize_delta(relative_delta, 'minutes')}."
+            f"War timer created for {proper_zone}, in {humanize_delta(war_time - now)}."
         )
 
         # defenders = await self.ask_question(ctx, "Who are the defenders?", {":x:": None, ":regional_indicator_c:": "Covenant", ":regional_indicator_s:": "Syndicate", ":regional_indicator_m:": "Marauders"})
@@ -152,105 +155,50 @@ class WarTimers(commands.Cog):
             await ctx.send(f"{zone} is not a valid zone.")
             return
 
-        timer = await self.get_timer_for_zone(ctx, proper_zone)
+        now = datetime.datetime.now()
+        timer = await self.get_timer_for_zone(ctx, proper_zone, now)
         if not timer:
             await ctx.send(f"There are no active wars set for {zone} to remove.")
             return
 
         await self.add_timer_for_zone(
-            ctx, proper_zone, datetime.datetime.now()
+            ctx, proper_zone, now
         )  # Now will just instantly invalidate the timer
         await ctx.send(f"War timer for {zone} was removed.")
 
-    async def get_timer_for_zone(self, ctx, zone):
+    async def get_timer_for_zone(self, ctx, zone, now=None):
+        if now is None:
+            now = datetime.datetime.now()
         guild_config = self.config.guild(ctx.guild)
         timers = await guild_config.timers()
         timer = timers.get(zone)
         if not timer:
             return None
-        datetime_instance = datetime.datetime.fromisoformat(timer)
-        if datetime.datetime.now() > datetime_instance:
+        if isinstance(timer, str):
+            # Timers used to be stored as isoformat strings
+            timer = datetime.datetime.fromisoformat(timer).timestamp()
+        if now.timestamp() > timer:
             return None
-        return datetime_instance
+        return datetime.datetime.fromtimestamp(timer)
 
     async def add_timer_for_zone(self, ctx, zone, timestamp):
         guild_config = self.config.guild(ctx.guild)
-        timers = await guild_config.timers()
         async with guild_config.timers() as timers:
-            timers[zone] = timestamp.isoformat()
+            timers[zone] = timestamp.timestamp()
 
     def get_proper_zone(self, zone):
         # Check if the zone is valid
-        lower_zones = [z.lower() for z in VALID_ZONES]
-        if zone.lower() not in lower_zones:
+        lower_zone = zone.lower()
+        if lower_zone not in _LOWER_ZONES_SET:
             return None
-        return VALID_ZONES[lower_zones.index(zone.lower())]
-
-
-RFC1123_FORMAT = "%a, %d %b %Y %H:%M:%S GMT"
-INFRACTION_FORMAT = "%Y-%m-%d %H:%M"
-
-
-def _stringify_time_unit(value: int, unit: str) -> str:
-    """
-    Returns a string to represent a value and time unit, ensuring that it uses the right plural form of the unit.
-
-    >>> _stringify_time_unit(1, "seconds")
-    "1 second"
-    >>> _stringify_time_unit(24, "hours")
-    "24 hours"
-    >>> _stringify_time_unit(0, "minutes")
-    "less than a minute"
-    """
-    if value == 1:
-        return f"{value} {unit[:-1]}"
-    elif value == 0:
-        return f"less than a {unit[:-1]}"
-    else:
-        return f"{value} {unit}"
-
-
-def humanize_delta(
-    delta: relativedelta, precision: str = "seconds", max_units: int = 6
-) -> str:
-    """
-    Returns a human-readable version of the relativedelta.
-
-    precision specifies the smallest unit of time to include (e.g. "seconds", "minutes").
-    max_units specifies the maximum number of units of time to include (e.g. 1 may include days but not hours).
-    """
-    if max_units <= 0:
-        raise ValueError("max_units must be positive")
-
-    units = (
-        ("years", delta.years),
-        ("months", delta.months),
-        ("days", delta.days),
-        ("hours", delta.hours),
-        ("minutes", delta.minutes),
-        ("seconds", delta.seconds),
-    )
+        return VALID_ZONES[_LOWER_ZONES.index(lower_zone)]
 
-    # Add the time units that are >0, but stop at accuracy or max_units.
-    time_strings = []
-    unit_count = 0
-    for unit, value in units:
-        if value:
-            time_strings.append(_stringify_time_unit(value, unit))
-            unit_count += 1
-
-        if unit == precision or unit_count >= max_units:
-            break
-
-    # Add the 'and' between the last two units, if necessary
-    if len(time_strings) > 1:
-        time_strings[-1] = f"{time_strings[-2]} and {time_strings[-1]}"
-        del time_strings[-2]
-
-    # If nothing has been found, just make the value 0 precision, e.g. `0 days`.
-    if not time_strings:
-        humanized = _stringify_time_unit(0, precision)
-    else:
-        humanized = ", ".join(time_strings)
-
-    return humanized
+
+def humanize_delta(delta: datetime.timedelta) -> str:
+    "Returns a human-readable version of the timedelta, to the minute."
+    minutes = int(delta.total_seconds() // 60)
+    if minutes < 1:
+        return "less than a minute"
+    return humanize.precisedelta(
+        datetime.timedelta(minutes=minutes), minimum_unit="minutes", format="%d"
+    )
@@ -1,6 +1,7 @@
 import datetime
 import logging
 import random
+import time
 
 import discord
 from redbot.core import Config, commands
@@ -24,45 +25,73 @@ class QuoteDB(commands.Cog):
 
         self.config.register_guild(**default_guild)
 
+        # guild_id -> {trigger: ([(quote_id, content), ...], {quote_id: position})}
+        self._quote_index = {}
+
+    async def cog_load(self):
+        all_guilds = await self.config.all_guilds()
+        for guild_id, data in all_guilds.items():
+            self._quote_index[guild_id] = self._build_index(data["quotes"]["id"])
+
+    @classmethod
+    def _build_index(cls, quotes):
+        index = {}
+        for qid, data in quotes.items():
+            cls._index_add(index, data["trigger"], qid, data["content"])
+        return index
+
+    @staticmethod
+    def _index_add(index, trigger, qid, content):
+        entries, positions = index.setdefault(trigger, ([], {}))
+        positions[qid] = len(entries)
+        entries.append((qid, content))
+
+    @staticmethod
+    def _index_remove(index, trigger, qid):
+        "Remove a quote by swapping the last entry into its slot"
+        entries, positions = index.get(trigger, ([], {}))
+        position = positions.pop(qid, None)
+        if position is None:
+            return
+        last = entries.pop()
+        if position < len(entries):
+            entries[position] = last
+            positions[last[0]] = position
+
     @commands.guild_only()
     @commands.command(name=".")
     async def quote_add(self, ctx, trigger: str, *, quote: str):
         'Add a new quote'
         guild_group = self.config.guild(ctx.guild)
-        incr = await guild_group.quotes.incr() + 1
-        await guild_group.quotes.incr.set(incr)
-        async with guild_group.quotes.id() as quotes, guild_group.quotes.trigger() as triggers:
-            quotes[incr] = {
+        async with guild_group.quotes() as quote_data:
+            incr = quote_data["incr"] + 1
+            quote_data["incr"] = incr
+            qid = str(incr)
+            quotes, triggers = quote_data["id"], quote_data["trigger"]
+            quotes[qid] = {
                 "content": quote,
                 "user": ctx.author.id,
                 "trigger": trigger,
                 "jump_url": ctx.message.jump_url,
-                "datetime": datetime.datetime.now().timestamp()
+                "datetime": time.time()
             }
 
-            triggers.setdefault(trigger, [])
-            triggers[trigger] += [str(incr)]
+            triggers.setdefault(trigger, []).append(qid)
 
-        await ctx.send(f"{ctx.author.mention}, added quote `#{incr}`.")
+        guild_index = self._quote_index.setdefault(ctx.guild.id, {})
+        self._index_add(guild_index, trigger, qid, quote)
+
+        await ctx.send(f"{ctx.author.mention}, added quote `#{qid}`.")
 
     @commands.guild_only()
     @commands.command(name="..")
     async def quote_show(self, ctx, *, trigger: str):
         'Show a quote'
-        
-        guild_group = self.config.guild(ctx.guild)
-
-        trigger_data = await guild_group.quotes.trigger()
-        triggers = None
-        try:
-            triggers = trigger_data[trigger]
-        except KeyError:
+        entries, _ = self._quote_index.get(ctx.guild.id, {}).get(trigger, ([], {}))
+        if not entries:
             await ctx.send("Quote not found, add one `.. <trigger> <quote>`")
             return
-        quote_id = random.choice(triggers)
-
-        quotes = await guild_group.quotes.id()
-        quote = quotes[str(quote_id)]['content']
+        quote_id, quote = random.choice(entries)
         await ctx.send(f"`#{quote_id}` :mega: {quote}")
 
     @commands.guild_only()
@@ -70,18 +99,22 @@ class QuoteDB(commands.Cog):
     async def quote_del(self, ctx, *, qid: str):
         'Delete a quote'
         guild_group = self.config.guild(ctx.guild)
-        async with guild_group.quotes.id() as quotes, guild_group.quotes.trigger() as triggers:
-            if qid not in quotes:
-                await ctx.send(f"{ctx.author.mention}, invalid quote id.")
-                return
-            data = quotes[qid]
-            member = discord.utils.find(lambda m: m.id == data['user'], ctx.channel.guild.members)
-            if ctx.author != member and not await self.bot.is_admin(ctx.author):
-                await ctx.send(f"{ctx.author.mention}, only the creator (or admins) can delete that.")
-                return
-            trigger = data['trigger']
-            del quotes[qid]
-            triggers[trigger].remove(qid)
+        data = await guild_group.quotes.id.get_raw(qid, default=None)
+        if data is None:
+            await ctx.send(f"{ctx.author.mention}, invalid quote id.")
+            return
+        member = ctx.guild.get_member(data['user'])
+        if ctx.author != member and not await self.bot.is_admin(ctx.author):
+            await ctx.send(f"{ctx.author.mention}, only the creator (or admins) can delete that.")
+            return
+
+        trigger = data['trigger']
+        async with guild_group.quotes() as quote_data:
+            quotes, triggers = quote_data["id"], quote_data["trigger"]
+            if quotes.pop(qid, None) is not None:
+                triggers[trigger].remove(qid)
+
+        self._index_remove(self._quote_index.get(ctx.guild.id, {}), trigger, qid)
 
         await ctx.send(f"{ctx.author.mention}, deleted quote #{qid}.")
 
@@ -90,33 +123,20 @@ class QuoteDB(commands.Cog):
     async def quote_info(self, ctx, *, qid: str):
         'Show details about a quote'
         guild_group = self.config.guild(ctx.guild)
-        quotes = await guild_group.quotes.id()
-        if qid not in quotes:
+        data = await guild_group.quotes.id.get_raw(qid, default=None)
+        if data is None:
             await ctx.send(f"{ctx.author.mention}, invalid quote id.")
             return
-        data = quotes[qid]
             
-        member = discord.utils.find(lambda m: m.id == data['user'], ctx.channel.guild.members)
-
-        log = discord.Embed()
-        log.type = "rich"
+        member = ctx.guild.get_member(data['user'])
+        member_name = str(member) if member else "Unknown user"
 
-        log.set_author(name=member, url=data['jump_url'])
-        log.title = f"Quote Info - #{qid}"
+        log = discord.Embed(title=f"Quote Info - #{qid}")
+        log.set_author(name=member_name, url=data['jump_url'])
 
         created_at = datetime.datetime.fromtimestamp(data['datetime'])
-        log.add_field(
-            name=f"{data['trigger']}",
-            value=f"{data['content']}",
-            inline=False
-        )
-        log.add_field(
-            name=f"Author",
-            value=f"{member}",
-        )
-        log.add_field(
-            name=f"Created",
-            value=f"{created_at}",
-        )
+        log.add_field(name=data['trigger'], value=data['content'], inline=False)
+        log.add_field(name="Author", value=member_name)
+        log.add_field(name="Created", value=f"{created_at}")
 
         await ctx.send(embed=log)
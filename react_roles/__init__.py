@@ -1,8 +1,8 @@
 from .react_roles import RoleReacts
 
 
-def setup(bot):
-    bot.add_cog(RoleReacts(bot))
+async def setup(bot):
+    await bot.add_cog(RoleReacts(bot))
 
 
 __version__ = "1.0.0"
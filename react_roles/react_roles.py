@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import logging
 import random
@@ -11,6 +12,8 @@ default_guild = {
     "watching": {},
 }
 
+log = logging.getLogger("red.cog.react_roles")
+
 
 class RoleReacts(commands.Cog):
     "Adds roles to people who react to a message"
@@ -23,6 +26,71 @@ class RoleReacts(commands.Cog):
         )
         self.config.register_guild(**default_guild)
 
+        # guild_id -> watching, kept in sync with config so listeners avoid I/O
+        self._watching_cache = {}
+        # guild_id -> change counter, cleared once that change is written
+        self._dirty_guilds = {}
+        self._flush_task = None
+
+    async def cog_load(self):
+        all_guilds = await self.config.all_guilds()
+        self._watching_cache = {
+            guild_id: data["watching"] for guild_id, data in all_guilds.items()
+        }
+
+    async def _get_watching(self, guild_id):
+        "Get the cached watching for a guild, loading it from config on a miss"
+        watching = self._watching_cache.get(guild_id)
+        if watching is None:
+            watching = await self.config.guild_from_id(guild_id).watching()
+            watching = self._watching_cache.setdefault(guild_id, watching)
+        return watching
+
+    async def _get_role_id(self, guild_id, message_id, reaction_id):
+        "Get the role for a watched reaction, caching the guild on a miss"
+        watching = await self._get_watching(guild_id)
+        return watching.get(message_id, {}).get(reaction_id)
+
+    async def cog_unload(self):
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+        await self._flush()
+
+    def _schedule_flush(self, guild_id):
+        "Mark a guild's watching as changed and write it out shortly after"
+        self._dirty_guilds[guild_id] = self._dirty_guilds.get(guild_id, 0) + 1
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_after(1.0))
+
+    async def _flush_after(self, delay):
+        await asyncio.sleep(delay)
+        await asyncio.shield(self._flush())
+        if self._dirty_guilds:
+            # A write failed, retry with backoff rather than waiting for another change
+            self._flush_task = asyncio.create_task(self._flush_after(min(delay * 2, 60.0)))
+
+    async def _flush(self):
+        attempted = {}
+        while True:
+            # Retry guilds changed during a write, but not ones that just failed
+            pending = [
+                (guild_id, version)
+                for guild_id, version in self._dirty_guilds.items()
+                if attempted.get(guild_id) != version
+            ]
+            if not pending:
+                return
+            for guild_id, version in pending:
+                attempted[guild_id] = version
+                watching = self._watching_cache.get(guild_id, {})
+                try:
+                    await self.config.guild_from_id(guild_id).watching.set(watching)
+                except Exception:
+                    log.exception("Failed to save reaction roles for guild %s", guild_id)
+                    continue
+                if self._dirty_guilds.get(guild_id) == version:
+                    del self._dirty_guilds[guild_id]
+
     @commands.command()
     @commands.has_permissions(manage_roles=True)
     async def add_react(
@@ -35,8 +103,7 @@ class RoleReacts(commands.Cog):
     ):
         "Setup a Reaction role for a specific message"
 
-        guild_config = self.config.guild(ctx.guild)
-        watching = await guild_config.watching()
+        watching = await self._get_watching(ctx.guild.id)
         react_id = str(react.id)
 
         if message_id in watching and react_id in watching[message_id]:
@@ -48,12 +115,12 @@ class RoleReacts(commands.Cog):
             await ctx.send("That message doesn't exist anymore.")
             return
 
-        watching.setdefault(message_id, {})
+        await message.add_reaction(react)
 
-        watching[message_id][react.id] = role.id
+        watching.setdefault(message_id, {})
 
-        await message.add_reaction(react)
-        await guild_config.watching.set(watching)
+        watching[message_id][react_id] = role.id
+        self._schedule_flush(ctx.guild.id)
         await ctx.send("Reaction setup.")
 
     @commands.command()
@@ -63,60 +130,67 @@ class RoleReacts(commands.Cog):
     ):
         "Removes a Reaction role for a specific message"
 
-        guild_config = self.config.guild(ctx.guild)
-        watching = await guild_config.watching()
+        watching = await self._get_watching(ctx.guild.id)
         react_id = str(react.id)
 
-        message = await channel.fetch_message(message_id)
-        if not message:
-            await ctx.send("That message doesn't exist anymore.")
-            return
-        if message_id not in watching or react_id not in watching[message_id]:
+        reactions = watching.get(message_id)
+        if not reactions or reactions.pop(react_id, None) is None:
             await ctx.send("Not monitoring that message, nothing to do.")
             return
 
-        del watching[message_id][str(react.id)]
-        if len(watching[message_id].keys()) == 0:
+        if not reactions:
             del watching[message_id]
-
-        await guild_config.watching.set(watching)
-        await message.remove_reaction(react, ctx.me)
+        self._schedule_flush(ctx.guild.id)
+
+        # No need to fetch the message just to remove our own reaction
+        message = channel.get_partial_message(int(message_id))
+        try:
+            await message.remove_reaction(react, ctx.me)
+        except discord.NotFound:
+            pass
         await ctx.send("Reaction removed.")
         
 
     @commands.Cog.listener()
     async def on_raw_reaction_add(self, payload):
-        guild = self.bot.get_guild(payload.guild_id)
-        if not guild:
+        if payload.guild_id is None:
+            return
+        if payload.member and payload.member.bot:
             return
 
-        guild_config = self.config.guild(guild)
-        watching = await guild_config.watching()
+        role_id = await self._get_role_id(
+            payload.guild_id, str(payload.message_id), str(payload.emoji.id)
+        )
+        if not role_id:
+            return
 
-        message_id = str(payload.message_id)
-        if message_id not in watching:
+        guild = self.bot.get_guild(payload.guild_id)
+        if not guild:
             return
 
-        reaction_id = str(payload.emoji.id)
-        role_id = watching[message_id][reaction_id]
         role = guild.get_role(role_id)
-        await payload.member.add_roles(role)
+        if role is None:
+            return
+        await payload.member.add_roles(role, reason="React roles")
 
     @commands.Cog.listener()
     async def on_raw_reaction_remove(self, payload):
-        guild = self.bot.get_guild(payload.guild_id)
-        if not guild:
+        if payload.guild_id is None:
             return
 
-        guild_config = self.config.guild(guild)
-        watching = await guild_config.watching()
+        role_id = await self._get_role_id(
+            payload.guild_id, str(payload.message_id), str(payload.emoji.id)
+        )
+        if not role_id:
+            return
 
-        message_id = str(payload.message_id)
-        if message_id not in watching:
+        guild = self.bot.get_guild(payload.guild_id)
+        if not guild:
             return
 
-        reaction_id = str(payload.emoji.id)
-        role_id = watching[message_id][reaction_id]
         role = guild.get_role(role_id)
         # on_raw_reaction_remove doesn't populate payload.member
-        await guild.get_member(payload.user_id).remove_roles(role)
+        member = guild.get_member(payload.user_id)
+        if role is None or member is None:
+            return
+        await member.remove_roles(role, reason="React roles")